@@ -0,0 +1,71 @@
+"""Numba kernels for the mesh generator.
+
+Only imported when Numba is installed. The kernels are cached on disk
+so each process doesn't pay the JIT cost again.
+"""
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, cache=True)
+def scatter_forces(bars, Fvec, N, nchunks):
+    """Sum the bar forces onto the nodes, one private (N, dim) accumulator
+    per chunk of bars. The result only depends on `nchunks`, not on the
+    number of threads.
+    """
+    nbars, dim = Fvec.shape
+    chunk = (nbars + nchunks - 1) // nchunks
+    # chunk-private accumulators avoid races on shared nodes
+    acc = np.zeros((nchunks, N, dim))
+    for k in numba.prange(nchunks):
+        for i in range(k * chunk, min((k + 1) * chunk, nbars)):
+            for j in range(dim):
+                acc[k, bars[i, 0], j] += Fvec[i, j]
+                acc[k, bars[i, 1], j] -= Fvec[i, j]
+    Ftot = np.zeros((N, dim))
+    for n in numba.prange(N):
+        for k in range(nchunks):
+            for j in range(dim):
+                Ftot[n, j] += acc[k, n, j]
+    return Ftot
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def bar_lengths(p, bars):
+    """Length and midpoint of each bar"""
+    nbars, dim = bars.shape[0], p.shape[1]
+    L = np.empty(nbars)
+    pmid = np.empty((nbars, dim))
+    for i in numba.prange(nbars):
+        a, b = bars[i, 0], bars[i, 1]
+        L2 = 0.0
+        for j in range(dim):
+            dx = p[a, j] - p[b, j]
+            L2 += dx * dx
+            pmid[i, j] = 0.5 * (p[a, j] + p[b, j])
+        L[i] = np.sqrt(L2) if L2 > 0 else np.finfo(np.float64).eps
+    return L, pmid
+
+
+@numba.njit(parallel=True, cache=True)
+def bar_forces(p, bars, L, hbars, L0mult):
+    """Force vector of each bar and the number of bars in tension"""
+    nbars, dim = bars.shape[0], p.shape[1]
+    # summed serially (and without fastmath) so the scaling, and hence the
+    # mesh, doesn't depend on the number of threads
+    sumL = 0.0
+    sumH = 0.0
+    for i in range(nbars):
+        sumL += L[i] ** dim
+        sumH += hbars[i] ** dim
+    scale = L0mult * (sumL / sumH) ** (1.0 / dim)
+    Fvec = np.empty((nbars, dim))
+    ntension = 0
+    for i in numba.prange(nbars):
+        F = max(hbars[i] * scale - L[i], 0.0) / L[i]
+        if F > 0:
+            ntension += 1
+        a, b = bars[i, 0], bars[i, 1]
+        for j in range(dim):
+            Fvec[i, j] = F * (p[a, j] - p[b, j])
+    return Fvec, ntension
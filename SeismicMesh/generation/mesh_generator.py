@@ -19,6 +19,8 @@ import warnings
 
 import numpy as np
 from mpi4py import MPI
+from scipy import ndimage
+from scipy.interpolate import RegularGridInterpolator
 
 from .. import decomp, geometry, migration
 from .. import sizing
@@ -208,7 +210,7 @@ def sliver_removal(points, domain, edge_length, comm=None, **kwargs):  # noqa: C
         num_move = 0
         # Using CGAL's incremental Delaunay triangulation capabilities.
         if count > 0:
-            to_move = np.where(_dist(p, pold) > 0)[0]
+            to_move = np.where(_dist2(p, pold) > 0)[0]
             dt.move(to_move.ravel().tolist(), p[to_move].ravel().tolist())
 
         # Get the current topology of the triangulation
@@ -329,6 +331,9 @@ def generate_mesh(domain, edge_length, comm=None, **kwargs):  # noqa: C901
         * *mesh_improvement* (`boolean`) --
             Whether or not to run a density-preserving Laplacian smoothing to improve mesh quality
             at the end of mesh generation (default=True)
+        * *sampler* (`string`) --
+            How to form the initial points: "grid" uses a staggered grid, "halton" streams
+            quasi-random Halton points in batches so that only the kept points are stored (default="grid")
 
 
     :return: points: vertex coordinates of mesh
@@ -350,6 +355,7 @@ def generate_mesh(domain, edge_length, comm=None, **kwargs):  # noqa: C901
         "geps_mult": 0.1,
         "subdomains": None,
         "mesh_improvement": True,
+        "sampler": "grid",
     }
     # check call was correct
     gen_opts.update(kwargs)
@@ -410,6 +416,9 @@ def generate_mesh(domain, edge_length, comm=None, **kwargs):  # noqa: C901
     if h0 < 0:
         raise ValueError("`h0` must be > 0")
 
+    if gen_opts["sampler"] not in {"grid", "halton"}:
+        raise ValueError("`sampler` must be either 'grid' or 'halton'")
+
     # these parameters originate from the original DistMesh
     L0mult = 1 + 0.4 / 2 ** (dim - 1)
     delta_t = gen_opts["delta_t"]
@@ -432,6 +441,9 @@ def generate_mesh(domain, edge_length, comm=None, **kwargs):  # noqa: C901
         dim, geps, bbox, fh, fd, h0, gen_opts, pfix, comm, lsf
     )
 
+    # sample gridded sizing functions with a single C-coded linear interpolation
+    fh = _fast_sizing_function(fh)
+
     if gen_opts["max_iter"] < 0:
         raise ValueError("`max_iter` must be > 0")
 
@@ -507,7 +519,8 @@ def generate_mesh(domain, edge_length, comm=None, **kwargs):  # noqa: C901
 
         # Show the user some progress so they know something is happening
         if comm.rank == 0:
-            maxdp = delta_t * np.sqrt((Ftot ** 2).sum(1)).max()
+            # sqrt is monotonic: take it once, of the largest squared norm
+            maxdp = delta_t * np.sqrt(np.einsum("ij,ij->i", Ftot, Ftot).max())
             print_msg2(
                 "Iteration #%d, max movement is %f, there are %d vertices and %d cells"
                 % (count + 1, maxdp, len(p), len(t)),
@@ -639,6 +652,7 @@ def _parse_kwargs(kwargs):
             "gamma",
             "preserve",
             "mesh_improvement",
+            "sampler",
         }:
             pass
         else:
@@ -688,23 +702,41 @@ def _compute_forces(p, t, fh, h0, L0mult):
     dim = p.shape[1]
     N = p.shape[0]
     edges = _get_edges(t)
-    barvec = p[edges[:, 0]] - p[edges[:, 1]]  # List of bar vectors
-    L = np.sqrt((barvec ** 2).sum(1))  # L = Bar lengths
-    L[L == 0] = np.finfo(float).eps
-    hedges = fh(p[edges].sum(1) / 2)
-    L0 = hedges * L0mult * ((L ** dim).sum() / (hedges ** dim).sum()) ** (1.0 / dim)
-    F = L0 - L
-    F[F < 0] = 0  # Bar forces (scalars)
-    Fvec = (
-        F[:, None] / L[:, None].dot(np.ones((1, dim))) * barvec
-    )  # Bar forces (x,y components)
-    Ftot = mutils.dense(
-        edges[:, [0] * dim + [1] * dim],
-        np.repeat([list(range(dim)) * 2], len(F), axis=0),
-        np.hstack((Fvec, -Fvec)),
-        shape=(N, dim),
-    )
-    return Ftot
+    Fvec = mutils.compute_bar_forces(p, edges, fh, L0mult)
+    if Fvec is None:
+        # every bar is compressed, nothing to scatter
+        return np.zeros((N, dim))
+    return mutils.scatter_forces(edges, Fvec, N)
+
+
+def _fast_sizing_function(fh):
+    """Evaluate a linear :class:`RegularGridInterpolator` on a uniform grid
+    with `ndimage.map_coordinates`. Any other sizing function is returned as is.
+    """
+    interpolant = fh
+    if getattr(fh, "__func__", None) is sizing.SizeFunction.eval and isinstance(
+        fh.__self__, sizing.SizeFunction
+    ):
+        interpolant = fh.__self__.cell_size
+    if not isinstance(interpolant, RegularGridInterpolator):
+        return fh
+    if interpolant.method != "linear":
+        return fh
+    grid = [np.asarray(vec, dtype=float) for vec in interpolant.grid]
+    if any(len(vec) < 2 for vec in grid):
+        return fh
+    origin = np.array([vec[0] for vec in grid])
+    spacing = np.array([(vec[-1] - vec[0]) / (len(vec) - 1) for vec in grid])
+    for vec, dx in zip(grid, spacing):
+        if not np.allclose(np.diff(vec), dx, rtol=1e-3, atol=0.0):
+            return fh
+    values = np.asarray(interpolant.values, dtype=float)
+
+    def func(x):
+        coords = (np.asarray(x) - origin) / spacing
+        return ndimage.map_coordinates(values, coords.T, order=1, mode="nearest")
+
+    return func
 
 
 def _add_ghost_vertices(p, t, dt, extents, comm):
@@ -728,28 +760,33 @@ def _add_ghost_vertices(p, t, dt, extents, comm):
 
 def _remove_triangles_outside(p, t, fd, geps):
     """Remove vertices outside the domain"""
-    dim = p.shape[1]
-    pmid = p[t].sum(1) / (dim + 1)  # Compute centroids
+    pmid = geometry.calc_centroids(p, t)  # Compute centroids
     return t[fd(pmid) < -geps]  # Keep interior triangles
 
 
+def _sdf_gradient(fd, x, d, deps):
+    """Forward difference gradient (dim, n) of `fd` at `x`, where d = fd(x).
+    Each coordinate is perturbed in turn and `fd` is evaluated once on the stack.
+    """
+    n, dim = x.shape
+    pert = np.tile(x, (dim, 1))
+    for i in range(dim):
+        pert[i * n : (i + 1) * n, i] += deps
+    return (fd(pert).reshape(dim, n) - d) / deps
+
+
 def _improve_level_set_newton(p, t, fd, deps, tol):
     """Reduce level set error by using Newton's minimization method"""
     dim = p.shape[1]
     bid = geometry.get_boundary_vertices(t, dim)
     alpha = 1
     for iteration in range(5):
-        d = fd(p[bid])
-
-        def _deps_vec(i):
-            a = [0] * dim
-            a[i] = deps
-            return a
-
-        dgrads = [(fd(p[bid] + _deps_vec(i)) - d) / deps for i in range(dim)]
-        dgrad2 = sum(dgrad ** 2 for dgrad in dgrads)
-        dgrad2 = np.where(dgrad2 < deps, deps, dgrad2)
-        p[bid] -= alpha * (d * np.vstack(dgrads) / dgrad2).T  # Project
+        pbid = p[bid]
+        d = fd(pbid)
+        dgrads = _sdf_gradient(fd, pbid, d, deps)
+        dgrad2 = np.einsum("ij,ij->j", dgrads, dgrads)
+        np.maximum(dgrad2, deps, out=dgrad2)
+        p[bid] -= alpha * (d * dgrads / dgrad2).T  # Project
         alpha /= iteration + 1
     return p
 
@@ -758,24 +795,16 @@ def _project_points_back_newton(p, fd, deps, hmin, idx):
     """Project points outside the domain back with one iteration of Newton minimization method
     finding the root of f(p)
     """
-    dim = p.shape[1]
-
     d = fd(p)
     if idx == 0:
         ix = d > 0.0
     else:
         ix = np.logical_and(d > 0.0, d < hmin / 1.5)
     if ix.any():
-
-        def _deps_vec(i):
-            a = [0] * dim
-            a[i] = deps
-            return a
-
-        dgrads = [(fd(p[ix] + _deps_vec(i)) - d[ix]) / deps for i in range(dim)]
-        dgrad2 = sum(dgrad ** 2 for dgrad in dgrads)
-        dgrad2 = np.where(dgrad2 < deps, deps, dgrad2)
-        p[ix] -= (d[ix] * np.vstack(dgrads) / dgrad2).T  # Project
+        dgrads = _sdf_gradient(fd, p[ix], d[ix], deps)
+        dgrad2 = np.einsum("ij,ij->j", dgrads, dgrads)
+        np.maximum(dgrad2, deps, out=dgrad2)
+        p[ix] -= (d[ix] * dgrads / dgrad2).T  # Project
     return p
 
 
@@ -800,22 +829,34 @@ def _user_defined_points(dim, fh, h0, bbox, points, comm, opts):
     return fh, p, extents
 
 
+def _generate_halton_points(h0, geps, dim, bbox, fh, fd, pfix, comm, opts):
+    """User did not specify initial points and asked for the Halton sampler"""
+    # Stream candidates in the local box owned by rank, rejecting against h0
+    _bbox = mutils.local_bbox(bbox, comm.rank, comm.size, opts["axis"], h0, dim)
+    np.random.seed(opts["seed"])
+    p = mutils.halton_points(_bbox, h0, dim, fd, fh, geps)
+    p = np.vstack((pfix, p))
+    extents = _form_extents(p, h0, comm, opts)
+    return fh, p, extents
+
+
 def _generate_initial_points(h0, geps, dim, bbox, fh, fd, pfix, comm, opts, lsf):
     """User did not specify initial points"""
     if comm.size > 1 and lsf:
         # Localize mesh size function grid.
         fh = migration.localize_sizing_function(fh, h0, bbox, dim, opts["axis"], comm)
+    if opts["sampler"] == "halton":
+        return _generate_halton_points(h0, geps, dim, bbox, fh, fd, pfix, comm, opts)
+    if comm.size > 1 or not lsf:
         # Create initial points in parallel in local box owned by rank
-        p = mutils.make_init_points(bbox, comm.rank, comm.size, opts["axis"], h0, dim)
-    elif not lsf:
-        # Create initial points in parallel in local box owned by rank
-        p = mutils.make_init_points(bbox, comm.rank, comm.size, opts["axis"], h0, dim)
+        p = mutils.make_init_points(
+            bbox, comm.rank, comm.size, opts["axis"], h0, dim, fd, geps
+        )
     else:
         # Create initial distribution in bounding box (equilateral triangles)
-        p = mutils.create_staggered_grid(h0, dim, bbox)
+        p = mutils.create_staggered_grid(h0, dim, bbox, fd, geps)
 
-    # Remove points outside the region, apply the rejection method
-    p = p[fd(p) < geps]  # Keep only d<0 points
+    # Points outside the region were removed slab by slab; apply the rejection method
     r0 = fh(p)
     r0m = r0.min()
     # Make sure decimation occurs uniformly accross ranks
@@ -857,9 +898,9 @@ def _form_extents(p, h0, comm, opts):
         return []
 
 
-def _dist(p1, p2):
-    """Euclidean distance between two sets of points"""
-    return np.sqrt(((p1 - p2) ** 2).sum(1))
+def _dist2(p1, p2):
+    """Squared Euclidean distance between two sets of points"""
+    return ((p1 - p2) ** 2).sum(1)
 
 
 def _unpack_pfix(dim, opts, comm):
@@ -1,33 +1,44 @@
 import copy
+import functools
 
 import numpy as np
-import scipy.sparse as spsparse
-
-
-def odd(r):
-    odds = []
-    for i in range(r):
-        if i % 2 != 0:
-            odds.append(i)
-    return odds
-
-
-def create_staggered_grid(h0, dim, bbox):
-    points = np.mgrid[tuple(slice(min, max + h0, h0) for min, max in bbox)].astype(
-        float
-    )
-    odds_rows = odd(points[0].shape[0])
-    odds_cols = odd(points[1].shape[0])
-    points[1][odds_rows] += h0 / 2
-    if dim == 3:
-        points[2][odds_cols] += h0 / 2
-    points = points.reshape(dim, -1).T
-    return points
 
 
-def make_init_points(bbox, rank, size, axis, h0, dim):
-    """Create a structured grid in parallel of the entire domain
-    Each processor owns a part of the domain.
+# points in each slab of the initial grid are sized to roughly fit in L2 cache
+_SLAB_BYTES = 2 ** 20
+
+
+def create_staggered_grid(h0, dim, bbox, fd=None, geps=None):
+    """Create a staggered grid with spacing `h0` covering `bbox`.
+    If `fd` is passed, the grid is formed in slabs along the first axis
+    and only points with fd(p) < geps are kept, so the full grid of the
+    bounding box is never held in memory at once.
+    """
+    vecs = [np.mgrid[(slice(min, max + h0, h0),)][0].astype(float) for min, max in bbox]
+    nrows = len(vecs[0])
+    if fd is None:
+        step = nrows
+    else:
+        row_size = int(np.prod([len(vec) for vec in vecs[1:]]))
+        step = max(1, _SLAB_BYTES // (8 * dim * row_size))
+    slabs = []
+    for start in range(0, nrows, step):
+        rows = np.arange(start, min(start + step, nrows))
+        points = np.array(np.meshgrid(vecs[0][rows], *vecs[1:], indexing="ij"))
+        odds_rows = rows % 2 != 0
+        points[1][odds_rows] += h0 / 2
+        if dim == 3:
+            points[2][odds_rows] += h0 / 2
+        points = points.reshape(dim, -1).T
+        if fd is not None:
+            points = points[fd(points) < geps]
+        slabs.append(points)
+    return np.concatenate(slabs)
+
+
+def local_bbox(bbox, rank, size, axis, h0, dim):
+    """Part of `bbox` owned by `rank` when the domain is split into
+    `size` pieces along `axis`.
     """
     _bbox = copy.deepcopy(bbox)
 
@@ -40,29 +51,100 @@ def make_init_points(bbox, rank, size, axis, h0, dim):
                 prev_lims = new_lims[rank - 1 : rank - 1 + 2]
                 tmp = np.mgrid[slice(prev_lims[0], prev_lims[1] + h0, h0)]
                 _bbox[i, 0] = tmp[-1] + h0
+    return _bbox
+
+
+def make_init_points(bbox, rank, size, axis, h0, dim, fd=None, geps=None):
+    """Create a structured grid in parallel of the entire domain
+    Each processor owns a part of the domain.
+    """
+    _bbox = local_bbox(bbox, rank, size, axis, h0, dim)
 
-    points = create_staggered_grid(h0, dim, _bbox)
+    points = create_staggered_grid(h0, dim, _bbox, fd, geps)
     return points
 
 
-def dense(Ix, J, S, shape=None, dtype=None):
+def halton_points(bbox, h0, dim, fd, fh, geps, batch_size=65536):
+    """Sample initial points from a Halton sequence over `bbox` with the
+    density of a grid of spacing `h0`. Candidates are drawn in batches and
+    each batch is filtered by fd(p) < geps and the (h0/fh(p))**dim rejection
+    test, so only the kept points are held in memory.
     """
-    Similar to MATLAB's SPARSE(I, J, S, ...), but instead returning a
-    dense array.
+    from scipy.stats import qmc
+
+    lo, hi = bbox[:, 0], bbox[:, 1]
+    num_candidates = int(np.prod(np.ceil((hi - lo) / h0 + 1)))
+    sampler = qmc.Halton(d=dim, scramble=False)
+    kept = [np.empty((0, dim))]
+    for start in range(0, num_candidates, batch_size):
+        points = lo + sampler.random(min(batch_size, num_candidates - start)) * (
+            hi - lo
+        )
+        points = points[fd(points) < geps]
+        if len(points) == 0:
+            continue
+        r0 = fh(points)
+        kept.append(points[np.random.rand(points.shape[0]) < h0 ** dim / r0 ** dim])
+    return np.concatenate(kept)
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernels():
+    """Load the Numba kernels module (None if Numba isn't installed)"""
+    try:
+        from . import _numba_kernels as kernels
+    except ImportError:
+        return None
+    return kernels
+
+
+# the Numba scatter sums the bars in a fixed number of chunks, each into its
+# own (N, dim) float64 accumulator; the count doesn't follow the thread count,
+# so the summation order (and the mesh) is the same on every machine
+_SCATTER_CHUNKS = 16
+# cap on the memory of those accumulators. They are allocated and zeroed on
+# every call, i.e. every mesh iteration, so this is extra peak memory too
+_SCATTER_BYTES = 2 ** 28
+
+
+def scatter_forces(bars, Fvec, N):
+    """Sum the bar forces `Fvec` onto the `N` nodes, adding at the
+    first node of each bar and subtracting at the second.
+    Uses a threaded Numba kernel when Numba is available. It sums
+    `_SCATTER_CHUNKS` chunks of bars into private (N, dim) float64
+    accumulators, fewer if those copies would exceed `_SCATTER_BYTES`.
     """
+    kernels = _numba_kernels()
+    if kernels is not None:
+        max_copies = _SCATTER_BYTES // (8 * max(1, N * Fvec.shape[1]))
+        nchunks = max(1, min(_SCATTER_CHUNKS, max_copies))
+        return kernels.scatter_forces(bars, Fvec, N, nchunks)
+    Ftot = np.zeros((N, Fvec.shape[1]))
+    np.add.at(Ftot, bars[:, 0], Fvec)
+    np.add.at(Ftot, bars[:, 1], -Fvec)
+    return Ftot
 
-    # Advanced usage: allow J and S to be scalars.
-    if np.isscalar(J):
-        x = J
-        J = np.empty(Ix.shape, dtype=int)
-        J.fill(x)
-    if np.isscalar(S):
-        x = S
-        S = np.empty(Ix.shape)
-        S.fill(x)
-
-    # Turn these into 1-d arrays for processing.
-    S = S.flat
-    II = Ix.flat
-    J = J.flat
-    return spsparse.coo_matrix((S, (II, J)), shape, dtype).toarray()
+
+def compute_bar_forces(p, bars, fh, L0mult):
+    """Force vector of each bar in `bars` given the sizing function `fh`,
+    or None if every bar is compressed.
+    Uses fused Numba loops when Numba is available.
+    """
+    dim = p.shape[1]
+    kernels = _numba_kernels()
+    if kernels is not None:
+        L, pmid = kernels.bar_lengths(p, bars)
+        hbars = np.asarray(fh(pmid), dtype=float)
+        Fvec, ntension = kernels.bar_forces(p, bars, L, hbars, L0mult)
+        return Fvec if ntension > 0 else None
+    pbars = p[bars]  # gather both end points of each bar once
+    barvec = pbars[:, 0] - pbars[:, 1]  # List of bar vectors
+    L = np.sqrt(np.einsum("ij,ij->i", barvec, barvec))  # L = Bar lengths
+    L[L == 0] = np.finfo(float).eps
+    hbars = fh(0.5 * (pbars[:, 0] + pbars[:, 1]))
+    L0 = hbars * L0mult * ((L ** dim).sum() / (hbars ** dim).sum()) ** (1.0 / dim)
+    F = L0 - L
+    np.maximum(F, 0, out=F)  # Bar forces (scalars)
+    if not F.any():
+        return None
+    return (F / L)[:, None] * barvec  # Bar forces (x,y components)
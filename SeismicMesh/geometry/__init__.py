@@ -1,6 +1,7 @@
 from _fast_geometry import (
     calc_3x3determinant,
     calc_4x4determinant,
+    calc_centroids,
     calc_circumsphere_grad,
     calc_dihedral_angles,
     calc_volume_grad,
@@ -56,6 +57,7 @@ __all__ = [
     "calc_circumsphere_grad",
     "calc_3x3determinant",
     "calc_4x4determinant",
+    "calc_centroids",
     "corners",
     "Rectangle",
     "Ball",
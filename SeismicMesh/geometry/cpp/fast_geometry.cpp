@@ -3,6 +3,7 @@
 #include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 #include <set>
+#include <string>
 #include <tuple>
 #include <vector>
 
@@ -702,6 +703,56 @@ py::array calc_circumsphere_grad(
                       ));
 }
 
+py::array calc_centroids(
+    py::array_t<double, py::array::c_style | py::array::forcecast> points,
+    py::array_t<int, py::array::c_style | py::array::forcecast> cells) {
+
+  // read the input arrays in place (no copy into std::vector); note that
+  // forcecast silently copies `cells` when it isn't int32 (e.g. int64)
+  auto p = points.unchecked<2>();
+  auto t = cells.unchecked<2>();
+  ssize_t num_cells = t.shape(0);
+  ssize_t num_verts = t.shape(1);
+  ssize_t dim = p.shape(1);
+  ssize_t num_points = p.shape(0);
+
+  // validate the cell indices once so the loop below can't read out of bounds
+  for (ssize_t ie = 0; ie < num_cells; ++ie) {
+    for (ssize_t k = 0; k < num_verts; ++k) {
+      if (t(ie, k) < 0 || t(ie, k) >= num_points) {
+        throw py::index_error("cell " + std::to_string(ie) +
+                              " refers to point " + std::to_string(t(ie, k)) +
+                              " out of " + std::to_string(num_points));
+      }
+    }
+  }
+
+  std::vector<double> centroids(num_cells * dim);
+  for (ssize_t ie = 0; ie < num_cells; ++ie) {
+    for (ssize_t j = 0; j < dim; ++j) {
+      double accum = 0.0;
+      for (ssize_t k = 0; k < num_verts; ++k) {
+        accum += p(t(ie, k), j);
+      }
+      centroids[ie * dim + j] = accum / num_verts;
+    }
+  }
+
+  ssize_t sodble = sizeof(double);
+  std::vector<ssize_t> shape = {num_cells, dim};
+  std::vector<ssize_t> strides = {sodble * dim, sodble};
+
+  // return 2-D NumPy array
+  return py::array(
+      py::buffer_info(centroids.data(), /* data as contiguous array  */
+                      sizeof(double),   /* size of one scalar        */
+                      py::format_descriptor<double>::format(), /* data type */
+                      2,      /* number of dimensions      */
+                      shape,  /* shape of the matrix       */
+                      strides /* strides for each axis     */
+                      ));
+}
+
 PYBIND11_MODULE(_fast_geometry, m) {
   m.def("remove_external_entities2", &remove_external_entities2);
   m.def("remove_external_entities3", &remove_external_entities3);
@@ -713,4 +764,5 @@ PYBIND11_MODULE(_fast_geometry, m) {
   m.def("calc_dihedral_angles", &calc_dihedral_angles);
   m.def("calc_4x4determinant", &calc_4x4determinant);
   m.def("calc_3x3determinant", &calc_3x3determinant);
+  m.def("calc_centroids", &calc_centroids);
 }
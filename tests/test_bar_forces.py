@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from SeismicMesh.generation import utils as mutils
+
+
+@pytest.mark.serial
+def test_bar_forces(monkeypatch):
+    """The Numba bar forces match the NumPy ones"""
+    pytest.importorskip("numba")
+    assert mutils._numba_kernels() is not None
+
+    def fh(p):
+        return 0.05 + 0.1 * np.abs(p[:, 0])
+
+    np.random.seed(0)
+    cases = []
+    for dim in (2, 3):
+        p = np.random.rand(500, dim)
+        bars = np.random.randint(0, len(p), size=(2000, 2)).astype(np.int32)
+        cases.append((p, bars, mutils.compute_bar_forces(p, bars, fh, 1.2)))
+
+    monkeypatch.setattr(mutils, "_numba_kernels", lambda: None)
+    for p, bars, Fvec in cases:
+        expected = mutils.compute_bar_forces(p, bars, fh, 1.2)
+        assert expected is not None
+        assert np.allclose(Fvec, expected)
+
+
+@pytest.mark.serial
+def test_bar_forces_compressed(monkeypatch):
+    """None is returned when every bar is compressed"""
+
+    def fh(p):
+        return np.full(len(p), 0.1)
+
+    # bars of equal length are all compressed when L0mult < 1
+    p = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+    bars = np.array([[0, 1], [1, 2], [2, 3], [3, 0]], dtype=np.int32)
+    assert mutils.compute_bar_forces(p, bars, fh, 0.5) is None
+    monkeypatch.setattr(mutils, "_numba_kernels", lambda: None)
+    assert mutils.compute_bar_forces(p, bars, fh, 0.5) is None
+
+
+if __name__ == "__main__":
+    test_bar_forces(pytest.MonkeyPatch())
+    test_bar_forces_compressed(pytest.MonkeyPatch())
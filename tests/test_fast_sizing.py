@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from scipy.interpolate import RegularGridInterpolator
+
+from SeismicMesh import SizeFunction
+from SeismicMesh.generation.mesh_generator import _fast_sizing_function
+
+
+@pytest.mark.serial
+def test_fast_sizing_function():
+    np.random.seed(0)
+    z_vec = np.linspace(-1000.0, 0.0, 51, dtype=np.float32)
+    x_vec = np.linspace(0.0, 2000.0, 101, dtype=np.float32)
+    cell_size = 50.0 + 100.0 * np.random.rand(len(z_vec), len(x_vec))
+    interpolant = RegularGridInterpolator(
+        (z_vec, x_vec), cell_size, bounds_error=False, fill_value=None
+    )
+    ef = SizeFunction((-1000.0, 0.0, 0.0, 2000.0), interpolant, 50.0)
+
+    fh = _fast_sizing_function(ef.eval)
+    assert fh is not ef.eval
+
+    # same values as the interpolant inside the grid
+    inside = np.column_stack(
+        (-1000.0 * np.random.rand(1000), 2000.0 * np.random.rand(1000))
+    )
+    assert np.allclose(fh(inside), interpolant(inside), rtol=1e-4)
+
+    # clamped to the nearest grid value outside of it (not extrapolated)
+    outside = np.array([[-1500.0, 1000.0], [100.0, -50.0], [-500.0, 2500.0]])
+    clamped = np.clip(outside, [-1000.0, 0.0], [0.0, 2000.0])
+    assert np.allclose(fh(outside), interpolant(clamped), rtol=1e-4)
+
+    # other sizing functions are left alone, including SizeFunction subclasses
+    class DoubledSizeFunction(SizeFunction):
+        def eval(self, x):
+            return 2 * self.cell_size(x)
+
+    doubled = DoubledSizeFunction((-1000.0, 0.0, 0.0, 2000.0), interpolant, 50.0)
+    assert _fast_sizing_function(doubled.eval) == doubled.eval
+
+    def user_fh(p):
+        return np.full(len(p), 100.0)
+
+    assert _fast_sizing_function(user_fh) is user_fh
+
+
+if __name__ == "__main__":
+    test_fast_sizing_function()
@@ -56,5 +56,38 @@ def test_geometry():
     assert np.sum(vol) == 8.0
 
 
+@pytest.mark.serial
+def test_unique_rows():
+    floats = np.array([[0.5, 1.0], [0.5, 2.0], [0.0, 0.0], [0.5, 1.0], [0.0, 0.0]])
+    ints = np.array([[3, 1, 2], [0, 0, 0], [3, 1, 2], [1, 2, 3]], dtype=np.int32)
+    for A, num_unique in ((floats, 3), (ints, 3)):
+        B, I, J = geo.unique_rows(A, return_index=True, return_inverse=True)
+        assert len(B) == num_unique
+        assert J.shape == (len(A),)
+        assert np.array_equal(A, B[J])
+        assert np.array_equal(B, A[I])
+
+
+@pytest.mark.serial
+def test_calc_centroids():
+    np.random.seed(0)
+    for dim in (2, 3):
+        points = np.random.rand(20, dim)
+        cells = np.random.randint(0, 20, size=(30, dim + 1)).astype(np.int32)
+        centroids = geo.calc_centroids(points, cells)
+        assert centroids.shape == (30, dim)
+        assert np.allclose(centroids, points[cells].sum(1) / (dim + 1))
+
+        empty = np.empty((0, dim + 1), dtype=np.int32)
+        assert geo.calc_centroids(points, empty).shape == (0, dim)
+
+        for bad in (-1, len(points)):
+            cells[3, 1] = bad
+            with pytest.raises(IndexError):
+                geo.calc_centroids(points, cells)
+
+
 if __name__ == "__main__":
     test_geometry()
+    test_unique_rows()
+    test_calc_centroids()
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from SeismicMesh import generate_mesh, geometry
+
+
+@pytest.mark.serial
+def test_halton():
+    """Unit disk meshed from Halton initial points"""
+    hmin = 0.1
+    disk = geometry.Disk([0.0, 0.0], 1)
+
+    points, cells = generate_mesh(domain=disk, edge_length=hmin, sampler="halton")
+
+    assert np.allclose(np.sum(geometry.simp_vol(points, cells)), np.pi, atol=hmin)
+    assert np.all(geometry.simp_vol(points, cells) > 0)
+    assert np.mean(geometry.simp_qual(points, cells)) > 0.9
+
+
+@pytest.mark.serial
+def test_halton_bad_sampler():
+    disk = geometry.Disk([0.0, 0.0], 1)
+    with pytest.raises(ValueError):
+        generate_mesh(domain=disk, edge_length=0.1, sampler="sobol")
+
+
+if __name__ == "__main__":
+    test_halton()
+    test_halton_bad_sampler()
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from SeismicMesh.generation import utils as mutils
+
+
+@pytest.mark.serial
+def test_scatter_forces(monkeypatch):
+    """The Numba force scatter matches `np.add.at`"""
+    numba = pytest.importorskip("numba")
+
+    np.random.seed(0)
+    N, dim = 1000, 3
+    bars = np.random.randint(0, N, size=(5000, 2)).astype(np.int32)
+    Fvec = np.random.rand(len(bars), dim)
+
+    expected = np.zeros((N, dim))
+    np.add.at(expected, bars[:, 0], Fvec)
+    np.add.at(expected, bars[:, 1], -Fvec)
+
+    assert mutils._numba_kernels() is not None
+    Ftot = mutils.scatter_forces(bars, Fvec, N)
+    assert np.allclose(Ftot, expected)
+
+    # the summation order doesn't depend on the number of threads
+    nthreads = numba.get_num_threads()
+    numba.set_num_threads(1)
+    try:
+        assert np.array_equal(mutils.scatter_forces(bars, Fvec, N), Ftot)
+    finally:
+        numba.set_num_threads(nthreads)
+
+    # a single accumulator when the memory budget only allows one copy
+    monkeypatch.setattr(mutils, "_SCATTER_BYTES", 8 * N * dim)
+    assert np.allclose(mutils.scatter_forces(bars, Fvec, N), expected)
+
+
+if __name__ == "__main__":
+    test_scatter_forces(pytest.MonkeyPatch())
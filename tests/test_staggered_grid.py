@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from SeismicMesh.generation import utils as mutils
+
+
+@pytest.mark.serial
+def test_staggered_grid_slabs(monkeypatch):
+    """Filtering slab by slab gives the same points as filtering the full grid"""
+
+    def ball(p):
+        return np.sqrt(((p - 0.1) ** 2).sum(1)) - 0.8
+
+    geps = 0.01
+    # a handful of rows per slab in 2d, one row per slab in 3d
+    monkeypatch.setattr(mutils, "_SLAB_BYTES", 2 ** 12)
+    for dim, h0 in ((2, 0.05), (3, 0.1)):
+        bbox = np.array([[-1.0, 1.0]] * dim)
+        full = mutils.create_staggered_grid(h0, dim, bbox)
+        expected = full[ball(full) < geps]
+        points = mutils.create_staggered_grid(h0, dim, bbox, ball, geps)
+        assert np.array_equal(points, expected)
+
+
+if __name__ == "__main__":
+    test_staggered_grid_slabs(pytest.MonkeyPatch())